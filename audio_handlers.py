@@ -1,8 +1,8 @@
-import time
-from threading import Thread
+from threading import Event, Thread
 from typing import TYPE_CHECKING, override
 
-from config import *
+from pyaudio import paContinue
+
 from utils import *
 
 if TYPE_CHECKING:
@@ -18,11 +18,24 @@ class Sender(Thread):
         self.device_info = device_info
 
         self.class_name: str = self.__class__.__name__  # Child class name: 'Speaker' or 'Microphone'
-        self.run_flag: bool = True
+        self.started_message: str = f"{Color.GREEN}{self.class_name} started{Color.RESET}"
+        self.stopped_message: str = f"{Color.RED}{self.class_name} stopped{Color.RESET}"
+        self.stop_event = Event()
 
     @override
     def run(self):
-        # Create audio stream instance
+        put_chunk, flush = self.app.data_channel.put_chunk, self.app.data_channel.flush
+        silence = generate_silence(self.config.chunk_size)
+
+        def callback(in_data, frame_count, time_info, status):
+            # Skip digital silence; the receiving end plays silence on underrun anyway
+            if in_data != silence:
+                put_chunk(in_data)
+            else:
+                flush()  # Do not hold the tail of the last sound until the next one
+            return None, paContinue
+
+        # Create audio stream instance; PortAudio invokes the callback from its own audio thread
         stream = self.app.audio_interface.open(
             rate=self.config.sample_rate,
             channels=self.config.channels,
@@ -30,22 +43,21 @@ class Sender(Thread):
             input=True,
             input_device_index=self.device_info['index'],
             frames_per_buffer=self.config.frames_per_chunk,
+            stream_callback=callback,
         )
-        print_(f"{Color.GREEN}{self.class_name} started{Color.RESET}")
+        print_(self.started_message)
         print_device_info(self)
 
-        while self.run_flag:
-            audio_chunk: bytes = stream.read(self.config.frames_per_chunk, exception_on_overflow=False)
-            self.app.data_channel.put_chunk(audio_chunk)
+        self.stop_event.wait()
 
         # Clean up
         stream.stop_stream()
         stream.close()
-        print_(f"{Color.RED}{self.class_name} stopped{Color.RESET}")
+        print_(self.stopped_message)
 
     def stop(self):
         if self.is_alive():
-            self.run_flag = False
+            self.stop_event.set()
             self.join()
 
 
@@ -57,11 +69,25 @@ class Receiver(Thread):
         self.device_info = device_info
 
         self.class_name: str = self.__class__.__name__  # Child class name: 'Speaker' or 'Microphone'
-        self.run_flag: bool = True
+        self.started_message: str = f"{Color.GREEN}{self.class_name} started{Color.RESET}"
+        self.stopped_message: str = f"{Color.RED}{self.class_name} stopped{Color.RESET}"
+        self.stop_event = Event()
 
     @override
     def run(self):
-        # Create audio stream instance
+        get_chunk = self.app.data_channel.get_chunk
+        chunk_size = self.config.chunk_size
+        silence = generate_silence(chunk_size)
+
+        def callback(in_data, frame_count, time_info, status):
+            # Never block the audio thread; play silence on underrun or a mismatched chunk,
+            # as PyAudio completes the stream when given fewer bytes than requested
+            audio_chunk = get_chunk()
+            if audio_chunk is None or len(audio_chunk) != chunk_size:
+                audio_chunk = silence
+            return audio_chunk, paContinue
+
+        # Create audio stream instance; PortAudio invokes the callback from its own audio thread
         stream = self.app.audio_interface.open(
             rate=self.config.sample_rate,
             channels=self.config.channels,
@@ -69,25 +95,21 @@ class Receiver(Thread):
             output=True,
             output_device_index=self.device_info['index'],
             frames_per_buffer=self.config.frames_per_chunk,
+            stream_callback=callback,
         )
-        print_(f"{Color.GREEN}{self.class_name} started{Color.RESET}")
+        print_(self.started_message)
         print_device_info(self)
 
-        while self.run_flag:
-            if (audio_chunk := self.app.data_channel.get_chunk()) is not None:
-                stream.write(audio_chunk, exception_on_underflow=False)
-            else:
-                # Allow time for the buffer to fill
-                time.sleep(BUFFER_TIME / 2)
+        self.stop_event.wait()
 
         # Clean up
         stream.stop_stream()
         stream.close()
-        print_(f"{Color.RED}{self.class_name} stopped{Color.RESET}")
+        print_(self.stopped_message)
 
     def stop(self):
         if self.is_alive():
-            self.run_flag = False
+            self.stop_event.set()
             self.join()
 
 
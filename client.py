@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+from functools import cache
 from threading import Thread
-from typing import override
 
 import pyaudiowpatch as pyaudio
 
@@ -16,55 +16,31 @@ class Speaker(Sender):
     """Continuously capture system audio and send it to the server."""
 
     def __init__(self, app: SoundBridgeClient, config: AudioConfig):
-        # Get default loopback device info
+        # Get default loopback device info; an idle loopback delivers no buffers, so the
+        # data channel's keepalive, not captured audio, keeps the server aware of this client
         device_info = app.audio_interface.get_default_wasapi_loopback()
 
         super().__init__(app, config, device_info)
 
-        # Helper to keep the loopback stream read always available
-        self.helper_thread = Thread(target=self.helper)
-
-    def helper(self):
-        """Continuously write empty audio to the default output device to prevent loopback read blocking."""
-        stream = self.app.audio_interface.open(
-            rate=self.config.sample_rate,
-            channels=self.config.channels,
-            format=self.config.audio_dtype,
-            output=True,
-        )
-        dummy_audio_data = bytes(self.config.chunk_size)
-
-        while self.run_flag:
-            stream.write(dummy_audio_data, exception_on_underflow=False)
-
-        # Clean up
-        stream.stop_stream()
-        stream.close()
-
-    @override
-    def run(self):
-        self.helper_thread.start()
-        super().run()
-        self.helper_thread.join()
-
 
 class Microphone(Receiver):
     """Continuously receive audio from the server and play it through the virtual cable."""
 
     def __init__(self, app: SoundBridgeClient, config: AudioConfig):
-        # Find Virtual Audio Cable (CABLE Input) and get its device info
-        for i in range(app.audio_interface.get_device_count()):
-            device_info = app.audio_interface.get_device_info_by_index(i)
-            if "CABLE Input" in device_info['name'] and device_info['hostApi'] == 0:  # MME
-                break
-        else:
-            raise RuntimeError("No CABLE Input device found")
+        device_info = find_cable_input(app.audio_interface)
 
         super().__init__(app, config, device_info)
 
 
 class SoundBridgeClient:
-    def __init__(self, server_host: str, data_port: int, speaker_config: AudioConfig, microphone_config: AudioConfig):
+    def __init__(
+            self,
+            audio_interface: pyaudio.PyAudio,
+            server_host: str,
+            data_port: int,
+            speaker_config: AudioConfig,
+            microphone_config: AudioConfig,
+    ):
         # Start data channel
         self.data_channel = DataChannel(
             is_server=False,
@@ -74,8 +50,8 @@ class SoundBridgeClient:
             receiver_config=microphone_config,
         )
 
-        # Initialize audio interface
-        self.audio_interface = pyaudio.PyAudio()
+        # Audio interface is owned by the caller and outlives this session
+        self.audio_interface = audio_interface
 
         # Instantiate speaker and microphone
         self.speaker = Speaker(self, speaker_config)
@@ -94,21 +70,35 @@ class SoundBridgeClient:
 
         self.speaker.stop()
         self.microphone.stop()
-        self.audio_interface.terminate()
         self.data_channel.stop()
 
 
+@cache
+def find_cable_input(audio_interface: pyaudio.PyAudio) -> dict:
+    """Find Virtual Audio Cable (CABLE Input) among MME devices; cached as the interface is shared across sessions."""
+    host_api_info = audio_interface.get_host_api_info_by_type(pyaudio.paMME)
+    for i in range(host_api_info['deviceCount']):
+        device_info = audio_interface.get_device_info_by_host_api_device_index(host_api_info['index'], i)
+        if "CABLE Input" in device_info['name']:
+            return device_info
+
+    raise RuntimeError("No CABLE Input device found")
+
+
 def main():
     def thread():
         while True:
             speaker_config = control_client.get_speaker_config()
             microphone_config = control_client.get_microphone_config()
 
-            with SoundBridgeClient(SERVER_HOST, DATA_PORT, speaker_config, microphone_config):
+            with SoundBridgeClient(audio_interface, SERVER_HOST, DATA_PORT, speaker_config, microphone_config):
                 control_client.wait_for_stop()
 
             control_client.wait_for_start()
 
+    # Initialize audio interface once; reinitializing PortAudio (and COM on Windows) per session is costly
+    audio_interface = pyaudio.PyAudio()
+
     control_client = ControlChannelClient(SERVER_HOST, CONTROL_PORT)
     Thread(target=thread, daemon=True).start()
 
@@ -5,9 +5,16 @@ SERVER_HOST: str = "192.168.0.120"
 DATA_PORT: int = 2025
 CONTROL_PORT: int = 2026
 SOCKET_TIMEOUT: float = 1.0  # seconds
+# Audio bytes per packet; with the 2-byte sequence header it must fit
+# in 1472 bytes (Ethernet MTU - IP/UDP headers), as DF is set
 MAX_PACKET_SIZE: int = 1024  # bytes
+# Caps unsent data on Windows, datagram size on macOS
+SEND_BUFFER_SIZE: int = 4 * MAX_PACKET_SIZE  # bytes
+# An idle client sends data packets this often, so the server keeps its address
+KEEPALIVE_INTERVAL: float = 0.5  # seconds
 
 # Audio Configuration
 AUDIO_DTYPE: int = paInt16  # 16-bit format
 FRAMES_PER_CHUNK: int = 128
 BUFFER_TIME: float = 0.2  # seconds
+MAX_QUEUE_TIME: float = 0.04  # seconds of received audio kept queued; older chunks are dropped
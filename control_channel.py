@@ -2,6 +2,7 @@ import socket
 import time
 from contextlib import suppress
 from threading import Thread
+from typing import Callable
 
 from config import *
 from utils import *
@@ -17,6 +18,13 @@ class ControlChannelServer:
         # Set to an invalid placeholder; will be updated with a valid address upon receiving data
         self.client_address = '', 0
 
+        self.request_handlers: dict[bytes, Callable[[], None]] = {
+            b'SPEAKER_CONFIG': self._send_speaker_config,
+            b'MICROPHONE_CONFIG': self._send_microphone_config,
+            b'TOGGLE_MICROPHONE': self._toggle_microphone,
+            b'HEARTBEAT': lambda: None,
+        }
+
         Thread(target=self._request_handler, daemon=True).start()
 
     def stop_client(self):
@@ -36,30 +44,32 @@ class ControlChannelServer:
 
     def _request_handler(self):
         while True:
-            previous_client_address = self.client_address
-            command, self.client_address = self.server_socket.recvfrom(MAX_PACKET_SIZE)
-
-            match command:
-                case b'SPEAKER_CONFIG' | b'MICROPHONE_CONFIG':
-                    config = (
-                        self.app_server.speaker.config
-                        if command == b'SPEAKER_CONFIG'
-                        else self.app_server.microphone.config
-                    )
-                    self.server_socket.sendto(command[:1] + config.to_bytes(), self.client_address)
-                    print_(f"{Color.CYAN}Sent {command.decode()} to client{Color.RESET}")
-                case b'TOGGLE_MICROPHONE':
-                    if self.app_server.microphone.is_alive():
-                        self.app_server.microphone.stop()
-                    else:
-                        self.app_server.microphone.start()
-                    self.server_socket.sendto(b'MIC ON' if self.app_server.microphone.is_alive() else b'MIC OFF',
-                                              self.client_address)
-                case b'HEARTBEAT':
-                    pass
-                case _:
-                    # Revert client address on unknown command
-                    self.client_address = previous_client_address
+            command, client_address = self.server_socket.recvfrom(MAX_PACKET_SIZE)
+
+            # Ignore unknown commands without adopting their sender as the client
+            if (handler := self.request_handlers.get(command)) is None:
+                continue
+
+            self.client_address = client_address
+            handler()
+
+    def _send_speaker_config(self):
+        self._send_config(b'SPEAKER_CONFIG', self.app_server.speaker.config)
+
+    def _send_microphone_config(self):
+        self._send_config(b'MICROPHONE_CONFIG', self.app_server.microphone.config)
+
+    def _send_config(self, command: bytes, config: AudioConfig):
+        self.server_socket.sendto(command[:1] + config.to_bytes(), self.client_address)
+        print_(f"{Color.CYAN}Sent {command.decode()} to client{Color.RESET}")
+
+    def _toggle_microphone(self):
+        if self.app_server.microphone.is_alive():
+            self.app_server.microphone.stop()
+        else:
+            self.app_server.microphone.start()
+        self.server_socket.sendto(b'MIC ON' if self.app_server.microphone.is_alive() else b'MIC OFF',
+                                  self.client_address)
 
 
 class ControlChannelClient:
@@ -1,12 +1,16 @@
 import socket
-import time
 from collections import deque
-from io import BytesIO
-from threading import Thread
+from threading import Condition, Thread
 
 from config import *
 from utils import *
 
+HAS_SENDMSG: bool = hasattr(socket.socket, 'sendmsg')  # Not available on Windows
+SEQ_SIZE: int = 2  # bytes; big-endian packet sequence number prefixed to every payload
+SEQ_MASK: int = (1 << 8 * SEQ_SIZE) - 1
+SEQ_LATE_WINDOW: int = 64  # packets; a sender that jumps further back has restarted its sequence numbers
+SEQ_MAX_LATE_RUN: int = 8  # consecutive late packets after which the sender is also taken as restarted
+
 
 class DataChannel:
     def __init__(
@@ -19,7 +23,9 @@ class DataChannel:
     ):
         # --- 1. Set Up Socket ---
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)  # UDP
-        self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0x10)  # IPTOS_LOWDELAY
+        self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0xB8)  # DSCP EF (expedited forwarding)
+        set_dont_fragment(self.socket)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
         self.socket.settimeout(SOCKET_TIMEOUT)
 
         self.is_server = is_server
@@ -28,14 +34,25 @@ class DataChannel:
             print_(f"UDP data channel listening on port {server_port}")
             self.dst_address = '', 0  # To be set on data receipt
         else:
-            self.socket.bind(("0.0.0.0", 0))  # Bind to an ephemeral port to prevent OSError on recvfrom
             self.dst_address = server_host, server_port
+            self.socket.connect(self.dst_address)  # Pin the route once; also binds an ephemeral port for recvfrom
 
         # --- 2. Initialize and Set Up Buffer and Parameters ---
         self.tx_buffer = self.rx_buffer = deque([b''])
+        self.tx_ready = Condition()  # Notified once a full packet of chunks is buffered, on flush, or on stop
+        self.tx_flush: bool = False  # Set to send a partially filled packet without waiting for more chunks
         self.tx_chunk_size = self.rx_chunk_size = 0
         self.tx_chunks_per_pkt = self.rx_chunks_per_pkt = 0
-        self.tx_pkt_duration = self.rx_pkt_duration = 0.
+        self.rx_max_queued_chunks = 0
+        self.rx_dropped_chunks = 0
+        self.tx_seq = 0
+        self.rx_last_seq: int | None = None  # None until the first packet from the current sender
+        self.rx_late_run = 0  # Consecutive packets discarded as late
+        # Reused to assemble packets where sendmsg is unavailable
+        self.tx_packet_buffer = bytearray(SEQ_SIZE + MAX_PACKET_SIZE)
+        self.tx_packet_view = memoryview(self.tx_packet_buffer)
+        # Reused by every receive to avoid per-packet allocation
+        self.rx_packet_buffer = bytearray(SEQ_SIZE + MAX_PACKET_SIZE)
 
         self._setup(sender_config, receiver_config)
 
@@ -54,11 +71,26 @@ class DataChannel:
     def stop(self):
         """Stop the sender and receiver loop threads."""
         self.run_flag = False
+        with self.tx_ready:
+            self.tx_ready.notify_all()
         self.sender_thread.join()
         self.receiver_thread.join()
 
+        if self.rx_dropped_chunks:
+            print_(f"{Color.YELLOW}Dropped {self.rx_dropped_chunks} stale received chunks{Color.RESET}")
+
     def put_chunk(self, chunk: bytes) -> None:
-        self.tx_buffer.append(chunk)
+        with self.tx_ready:
+            self.tx_buffer.append(chunk)
+            if len(self.tx_buffer) >= self.tx_chunks_per_pkt:
+                self.tx_ready.notify()
+
+    def flush(self) -> None:
+        """Send buffered chunks without waiting for a full packet."""
+        with self.tx_ready:
+            if self.tx_buffer:
+                self.tx_flush = True
+                self.tx_ready.notify()
 
     def get_chunk(self) -> bytes | None:
         try:
@@ -74,11 +106,18 @@ class DataChannel:
         self.tx_chunk_size = sender_config.chunk_size
         self.rx_chunk_size = receiver_config.chunk_size
 
+        # The sequence header is not counted against MAX_PACKET_SIZE, so power-of-two chunks fill a packet exactly
         self.tx_chunks_per_pkt = MAX_PACKET_SIZE // self.tx_chunk_size
         self.rx_chunks_per_pkt = MAX_PACKET_SIZE // self.rx_chunk_size
+        if not (self.tx_chunks_per_pkt and self.rx_chunks_per_pkt):
+            raise ValueError(f"Audio chunk size exceeds MAX_PACKET_SIZE ({MAX_PACKET_SIZE} bytes)")
 
-        self.tx_pkt_duration = sender_config.chunk_duration * self.tx_chunks_per_pkt
-        self.rx_pkt_duration = receiver_config.chunk_duration * self.rx_chunks_per_pkt
+        # Keep at least one full packet so that normal packet-sized bursts are never trimmed
+        self.rx_max_queued_chunks = max(int(MAX_QUEUE_TIME / receiver_config.chunk_duration), self.rx_chunks_per_pkt)
+        self.rx_dropped_chunks = 0
+        self.tx_flush = False
+        self.rx_last_seq = None
+        self.rx_late_run = 0
 
     def _start(self):
         """Start the sender and receiver loop threads."""
@@ -91,31 +130,96 @@ class DataChannel:
         self.receiver_thread.start()
 
     def _sender(self):
-        while self.run_flag:
-            # Wait for enough chunks
-            if len(self.tx_buffer) < self.tx_chunks_per_pkt:
-                time.sleep(self.tx_pkt_duration)
-                continue
-
-            # Send the packet
-            payload = b''.join(self.tx_buffer.popleft() for _ in range(self.tx_chunks_per_pkt))
-            try:
-                self.socket.sendto(payload, self.dst_address)
-            except OSError:
-                pass
-
-    def _receiver(self):
-        while self.run_flag:
-            try:
-                payload, sender_address = self.socket.recvfrom(MAX_PACKET_SIZE)
-            except TimeoutError:
-                continue
-
-            # Set destination as latest sender (server-side)
+        with raise_thread_priority():
+            # The server learns the client's address only from its data packets, so an idle client keeps sending
+            keepalive_interval = None if self.is_server else KEEPALIVE_INTERVAL
+
+            # Bind hot-loop lookups to locals once; buffers and sizes are fixed until the thread is restarted
+            tx_ready, tx_buffer, chunks_per_pkt = self.tx_ready, self.tx_buffer, self.tx_chunks_per_pkt
+            popleft, send = tx_buffer.popleft, self._send
+
+            def is_ready() -> bool:
+                return not self.run_flag or self.tx_flush or len(tx_buffer) >= chunks_per_pkt
+
+            while True:
+                # Wait for enough chunks; on flush or keepalive timeout, send whatever is buffered, even nothing
+                with tx_ready:
+                    tx_ready.wait_for(is_ready, keepalive_interval)
+                    if not self.run_flag:
+                        break
+                    chunks = [popleft() for _ in range(min(chunks_per_pkt, len(tx_buffer)))]
+                    if not tx_buffer:
+                        self.tx_flush = False
+
+                # Send the packet
+                header = self.tx_seq.to_bytes(SEQ_SIZE, 'big')
+                self.tx_seq = (self.tx_seq + 1) & SEQ_MASK
+                try:
+                    send([header, *chunks])
+                except OSError:
+                    pass
+
+    def _send(self, buffers: list[bytes]):
+        """Send buffers as one datagram, letting the kernel gather them where scatter-gather I/O is supported."""
+        # The client socket is connected and must not be given a destination address
+        if HAS_SENDMSG:
             if self.is_server:
-                self.dst_address = sender_address
+                self.socket.sendmsg(buffers, (), 0, self.dst_address)
+            else:
+                self.socket.sendmsg(buffers)
+        elif self.is_server:
+            self.socket.sendto(self._pack(buffers), self.dst_address)
+        else:
+            self.socket.send(self._pack(buffers))
+
+    def _pack(self, buffers: list[bytes]) -> memoryview:
+        """Copy buffers back to back into the reused packet buffer and return a view of the filled part."""
+        packet_buffer = self.tx_packet_buffer
+        offset = 0
+        for buffer in buffers:
+            end = offset + len(buffer)
+            packet_buffer[offset:end] = buffer  # Same length, so the bytearray is written in place, never resized
+            offset = end
+        return self.tx_packet_view[:offset]
 
-            # Append chunks to buffer
-            payload_stream = BytesIO(payload)
-            while chunk := payload_stream.read(self.rx_chunk_size):
-                self.rx_buffer.append(chunk)
+    def _receiver(self):
+        with raise_thread_priority():
+            # Bind hot-loop lookups to locals once; buffers and sizes are fixed until the thread is restarted
+            packet_buffer, recvfrom_into = self.rx_packet_buffer, self.socket.recvfrom_into
+            rx_buffer, chunk_size, max_queued_chunks = self.rx_buffer, self.rx_chunk_size, self.rx_max_queued_chunks
+            extend, popleft = rx_buffer.extend, rx_buffer.popleft
+            packet_view = memoryview(packet_buffer)
+
+            while self.run_flag:
+                try:
+                    packet_size, sender_address = recvfrom_into(packet_buffer)
+                except (TimeoutError, ConnectionError):  # Connected sockets report ICMP port unreachable
+                    continue
+                if packet_size < SEQ_SIZE:  # Too short to carry a sequence header
+                    continue
+
+                # Set destination as latest sender (server-side); a new sender restarts its sequence numbers
+                if self.is_server and sender_address != self.dst_address:
+                    self.dst_address = sender_address
+                    self.rx_last_seq = None
+
+                # Discard packets that arrive late or duplicated, as their audio slot has already been played;
+                # a larger backward jump or a run of late packets means the sender restarted, so resync to it
+                seq = int.from_bytes(packet_view[:SEQ_SIZE], 'big')
+                if (self.rx_last_seq is not None
+                        and (self.rx_last_seq - seq) & SEQ_MASK <= SEQ_LATE_WINDOW
+                        and self.rx_late_run < SEQ_MAX_LATE_RUN):
+                    self.rx_late_run += 1
+                    continue
+                self.rx_last_seq = seq
+                self.rx_late_run = 0
+
+                # Copy whole chunks out of the reused packet buffer;
+                # bytes past packet_size are left over from earlier packets, so a trailing partial chunk is dropped
+                extend(bytes(packet_view[offset:offset + chunk_size])
+                       for offset in range(SEQ_SIZE, packet_size - chunk_size + 1, chunk_size))
+
+                # Drop stale chunks so that a burst does not turn into a lasting playback delay
+                while len(rx_buffer) > max_queued_chunks:
+                    popleft()
+                    self.rx_dropped_chunks += 1
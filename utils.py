@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import ctypes
 import json
+import os
+import socket
+from contextlib import contextmanager, suppress
 from dataclasses import asdict, dataclass
 from datetime import datetime
-from functools import cached_property
+from functools import cache, cached_property
 
 import psutil
 from pyaudio import get_sample_size
@@ -26,9 +30,14 @@ class AudioConfig:
         """Chunk duration in seconds."""
         return self.frames_per_chunk / self.sample_rate
 
+    @cached_property
+    def serialized(self) -> bytes:
+        """JSON bytes of the instance, computed once since the instance is immutable."""
+        return json.dumps(self._to_dict()).encode()
+
     def to_bytes(self) -> bytes:
         """Serialize the instance to JSON bytes."""
-        return json.dumps(self._to_dict()).encode()
+        return self.serialized
 
     @staticmethod
     def from_bytes(data: bytes) -> AudioConfig | None:
@@ -77,6 +86,12 @@ def format_hz_to_khz(hz: int | float) -> str:
     return f'{khz:.3f}'.rstrip('0').rstrip('.')  # Remove unnecessary trailing zeros and decimal point
 
 
+@cache
+def generate_silence(size: int) -> bytes:
+    """Return a zero-filled audio buffer of `size` bytes, shared by all callers requesting the same size."""
+    return bytes(size)
+
+
 def print_(*args, **kwargs):
     return print(f"[{datetime.now().isoformat()}]", *args, **kwargs)
 
@@ -93,3 +108,42 @@ def raise_process_priority():
             print_("Set process priority to nice -10")
         except psutil.AccessDenied:
             print_("Permission denied: Run with sudo for nice -10 process priority")
+
+
+@contextmanager
+def raise_thread_priority():
+    """Raise the scheduling priority of the calling thread within the block; keep the default if not permitted."""
+    mmcss_handle = None
+
+    if psutil.WINDOWS:
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 15)  # THREAD_PRIORITY_TIME_CRITICAL
+
+        # Register with MMCSS so that the thread is scheduled as pro-audio work; NULL means not registered
+        avrt = ctypes.windll.avrt
+        avrt.AvSetMmThreadCharacteristicsW.restype = ctypes.c_void_p
+        avrt.AvRevertMmThreadCharacteristics.argtypes = [ctypes.c_void_p]
+        task_index = ctypes.c_ulong(0)
+        mmcss_handle = avrt.AvSetMmThreadCharacteristicsW("Pro Audio", ctypes.byref(task_index))
+    elif psutil.LINUX:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(80))  # PID 0 targets the calling thread
+        except PermissionError:
+            pass
+
+    try:
+        yield
+    finally:
+        if mmcss_handle:
+            ctypes.windll.avrt.AvRevertMmThreadCharacteristics(mmcss_handle)
+
+
+def set_dont_fragment(sock: socket.socket):
+    """Set the IP Don't Fragment flag so that oversized datagrams fail instead of being silently fragmented."""
+    with suppress(OSError):
+        if psutil.WINDOWS:
+            sock.setsockopt(socket.IPPROTO_IP, 14, 1)  # IP_DONTFRAGMENT
+        elif psutil.MACOS:
+            sock.setsockopt(socket.IPPROTO_IP, 28, 1)  # IP_DONTFRAG
+        elif psutil.LINUX:
+            sock.setsockopt(socket.IPPROTO_IP, 10, 2)  # IP_MTU_DISCOVER = IP_PMTUDISC_DO